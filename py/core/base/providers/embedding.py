@@ -4,7 +4,7 @@ import random
 import time
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, AsyncGenerator, AsyncIterable, Optional
 
 from litellm import AuthenticationError
 
@@ -25,6 +25,12 @@ class EmbeddingConfig(ProviderConfig):
     rerank_model: Optional[str] = None
     rerank_url: Optional[str] = None
     batch_size: int = 1
+    embed_batch_size: int = 512
+    max_concurrent_batches: int = 5
+    max_tokens_per_request: int = 300_000
+    pool_size: int = 100
+    rpm: Optional[int] = None
+    tpm: Optional[int] = None
     concurrent_request_limit: int = 256
     max_retries: int = 3
     initial_backoff: float = 1
@@ -148,6 +154,84 @@ class EmbeddingProvider(Provider):
         }
         return self._execute_with_backoff_sync(task)
 
+    async def stream_embeddings(
+        self,
+        texts: AsyncIterable[str],
+        batch_size: int = 32,
+        embed_workers: int = 8,
+        queue_size: int = 256,
+    ) -> AsyncGenerator[tuple[int, list[float]], None]:
+        """Embed a stream of texts through a bounded producer/consumer
+        pipeline, yielding ``(index, embedding)`` pairs as they complete.
+
+        Batching the incoming stream overlaps with the network round-trips
+        of in-flight batches, and the bounded queues provide backpressure
+        so a fast producer cannot buffer an unbounded amount of text.
+        Results arrive in completion order, not input order; callers that
+        need input order can scatter by the yielded index.
+        """
+        batch_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        async def producer():
+            try:
+                batch: list[tuple[int, str]] = []
+                idx = 0
+                async for text in texts:
+                    batch.append((idx, text))
+                    idx += 1
+                    if len(batch) >= batch_size:
+                        await batch_queue.put(batch)
+                        batch = []
+                if batch:
+                    await batch_queue.put(batch)
+            except Exception as e:
+                # Surface source failures to the consumer; without this a
+                # raising iterable would strand the workers on the batch
+                # queue and deadlock the generator.
+                await result_queue.put(e)
+            finally:
+                for _ in range(embed_workers):
+                    await batch_queue.put(None)
+
+        async def embed_worker():
+            try:
+                while True:
+                    batch = await batch_queue.get()
+                    if batch is None:
+                        break
+                    embeddings = await self.async_get_embeddings(
+                        [text for _, text in batch]
+                    )
+                    for (idx, _), embedding in zip(batch, embeddings):
+                        await result_queue.put((idx, embedding))
+            except Exception as e:
+                await result_queue.put(e)
+            await result_queue.put(None)
+
+        workers = [
+            asyncio.create_task(embed_worker())
+            for _ in range(embed_workers)
+        ]
+        producer_task = asyncio.create_task(producer())
+
+        try:
+            finished_workers = 0
+            while finished_workers < len(workers):
+                result = await result_queue.get()
+                if result is None:
+                    finished_workers += 1
+                    continue
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+            await producer_task
+            await asyncio.gather(*workers)
+        finally:
+            producer_task.cancel()
+            for worker in workers:
+                worker.cancel()
+
     @abstractmethod
     def rerank(
         self,
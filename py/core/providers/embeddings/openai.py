@@ -1,10 +1,28 @@
+import asyncio
+import base64
 import contextlib
+import functools
+import hashlib
 import logging
 import os
-from typing import Any
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
+import httpx
+import numpy as np
+import orjson
 import tiktoken
-from openai import AsyncOpenAI, AuthenticationError, OpenAI
+from openai import (
+    AsyncOpenAI,
+    AuthenticationError,
+    BadRequestError,
+    OpenAI,
+    RateLimitError,
+)
 from openai._types import NOT_GIVEN
 
 from core.base import (
@@ -13,10 +31,48 @@ from core.base import (
     EmbeddingProvider,
 )
 
-from .utils import truncate_texts_to_token_limit
-
 logger = logging.getLogger()
 
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process; the BPE merge tables
+    are expensive to parse and immutable afterwards."""
+    return tiktoken.get_encoding(name)
+
+
+class _AsyncTokenBucket:
+    """Token bucket refilling continuously at ``rate`` tokens/second.
+
+    Keeps aggregate token spend just under the configured TPM so large
+    ingests throttle smoothly instead of triggering 429 backoff storms.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float) -> None:
+        tokens = min(tokens, self._capacity)
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self._rate
+            await asyncio.sleep(wait)
+
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     MODEL_TO_TOKENIZER = {
@@ -29,6 +85,20 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         "text-embedding-3-small": [512, 1536],
         "text-embedding-3-large": [256, 1024, 3072],
     }
+    MODEL_TO_MAX_INPUT_TOKENS = {
+        "text-embedding-ada-002": 8191,
+        "text-embedding-3-small": 8191,
+        "text-embedding-3-large": 8191,
+    }
+    EMBED_CACHE_MAXSIZE = 10_000
+
+    # Clients (and their TLS contexts and connection pools) are expensive
+    # to build; share them across provider instances so per-request
+    # construction under FastAPI DI reuses one keepalive pool.
+    _CLIENT_CACHE: dict[
+        tuple, tuple[OpenAI, AsyncOpenAI, httpx.AsyncClient]
+    ] = {}
+    _CLIENT_REFCOUNTS: dict[tuple, int] = {}
 
     def __init__(self, config: EmbeddingConfig):
         super().__init__(config)
@@ -47,8 +117,40 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             )
         api_key = os.getenv("OPENAI_EMBEDDING_API_KEY")
         base_url = os.getenv("OPENAI_EMBEDDING_API_BASE")
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
-        self.async_client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self._client_cache_key = (api_key, base_url, config.pool_size)
+        with _CLIENT_CACHE_LOCK:
+            if self._client_cache_key not in self._CLIENT_CACHE:
+                # Keepalive connections dominate latency for concurrent
+                # batches; tune the httpx pool instead of accepting the
+                # SDK defaults so sub-batches reuse warm sockets rather
+                # than re-handshaking TLS. HTTP/2 multiplexes concurrent
+                # batch requests over one TCP/TLS connection, and httpx
+                # negotiates gzip for the multi-megabyte embedding
+                # response bodies by default.
+                http_client = httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=config.pool_size,
+                        max_keepalive_connections=config.pool_size,
+                    ),
+                    timeout=httpx.Timeout(60.0, connect=5.0),
+                )
+                self._CLIENT_CACHE[self._client_cache_key] = (
+                    OpenAI(api_key=api_key, base_url=base_url),
+                    AsyncOpenAI(
+                        api_key=api_key,
+                        base_url=base_url,
+                        http_client=http_client,
+                    ),
+                    http_client,
+                )
+            self.client, self.async_client, self._http_client = (
+                self._CLIENT_CACHE[self._client_cache_key]
+            )
+            self._CLIENT_REFCOUNTS[self._client_cache_key] = (
+                self._CLIENT_REFCOUNTS.get(self._client_cache_key, 0) + 1
+            )
+        self._closed = False
 
         if config.rerank_model:
             raise ValueError(
@@ -87,71 +189,461 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
                 OpenAIEmbeddingProvider.MODEL_TO_DIMENSIONS[self.base_model]
             )
 
-    def _get_dimensions(self):
+        # Resolve the per-request kwargs once: ada-002 rejects the
+        # dimensions parameter, every newer model accepts it.
+        self._base_kwargs: dict[str, Any] = {
+            "model": self.base_model,
+            "dimensions": (
+                NOT_GIVEN
+                if self.base_model == "text-embedding-ada-002"
+                else self.base_dimension
+            ),
+            # base64 is ~4x smaller on the wire than JSON floats and
+            # decodes via a single buffer copy instead of per-value parses
+            "encoding_format": "base64",
+        }
+
+        self.embed_batch_size = config.embed_batch_size
+        self._batch_semaphore = asyncio.Semaphore(
+            config.max_concurrent_batches
+        )
+
+        # Optional client-side limits sized from the account's OpenAI
+        # tier; staying just under RPM/TPM beats the throughput collapse
+        # of exponential-backoff storms once 429s start.
+        self._rpm_semaphore = (
+            asyncio.Semaphore(max(1, config.rpm // 60))
+            if config.rpm
+            else None
+        )
+        self._tpm_bucket = (
+            _AsyncTokenBucket(rate=config.tpm / 60, capacity=config.tpm)
+            if config.tpm
+            else None
+        )
+
+        # Pre-warm the encoding cache and keep the base model's encoding
+        # on the instance so hot paths skip the per-call dict lookups.
+        self._encoding = _get_encoding(
+            OpenAIEmbeddingProvider.MODEL_TO_TOKENIZER[self.base_model]
+        )
+
+        # L0 cache of whole-text embeddings keyed by content hash; repeat
+        # texts (system prompts, deduplicated chunks, re-run queries) skip
+        # the OpenAI round-trip entirely.
+        self._embed_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._embed_cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    async def aclose(self) -> None:
+        """Release this instance's share of the pooled clients.
+
+        The httpx pool is shared by every live instance with the same
+        credentials, so it is only closed (and evicted from the cache)
+        when the last instance referencing it releases it.
+        """
+        with _CLIENT_CACHE_LOCK:
+            if self._closed:
+                return
+            self._closed = True
+            remaining = (
+                self._CLIENT_REFCOUNTS.get(self._client_cache_key, 1) - 1
+            )
+            if remaining > 0:
+                self._CLIENT_REFCOUNTS[self._client_cache_key] = remaining
+                return
+            self._CLIENT_REFCOUNTS.pop(self._client_cache_key, None)
+            self._CLIENT_CACHE.pop(self._client_cache_key, None)
+        await self._http_client.aclose()
+
+    @staticmethod
+    def _embed_cache_key(
+        text: str | tuple[int, ...], kwargs: dict[str, Any]
+    ) -> tuple:
+        content = (
+            text.encode()
+            if isinstance(text, str)
+            else np.asarray(text, dtype=np.int32).tobytes()
+        )
         return (
-            NOT_GIVEN
-            if self.base_model == "text-embedding-ada-002"
-            else self.base_dimension
-            or OpenAIEmbeddingProvider.MODEL_TO_DIMENSIONS[self.base_model][-1]
+            kwargs.get("model"),
+            kwargs.get("dimensions"),
+            hashlib.blake2b(content, digest_size=16).digest(),
         )
 
+    def _embed_cache_get(self, key: tuple) -> Optional[np.ndarray]:
+        with self._embed_cache_lock:
+            embedding = self._embed_cache.get(key)
+            if embedding is not None:
+                self._embed_cache.move_to_end(key)
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+            return embedding
+
+    def _embed_cache_put(self, key: tuple, embedding: np.ndarray) -> None:
+        with self._embed_cache_lock:
+            self._embed_cache[key] = embedding
+            self._embed_cache.move_to_end(key)
+            while len(self._embed_cache) > self.EMBED_CACHE_MAXSIZE:
+                self._embed_cache.popitem(last=False)
+
+    def _truncate_texts_to_token_limit(
+        self, texts: list[str]
+    ) -> list[str | tuple[int, ...]]:
+        """Truncate texts that exceed the model's max input tokens.
+
+        Uses tiktoken's batch encoder, which releases the GIL and
+        parallelizes BPE merging across cores, instead of encoding one
+        text at a time. Over-limit texts stay in token-id space as
+        clipped tuples -- the embeddings API accepts token arrays
+        directly, so decoding back to a string (and re-encoding server
+        side) is pure waste; short texts pass through as raw strings.
+        """
+        max_tokens = OpenAIEmbeddingProvider.MODEL_TO_MAX_INPUT_TOKENS[
+            self.base_model
+        ]
+        # Cheap prefilter: a BPE token spans at least one character, so
+        # any text at or under max_tokens characters cannot exceed the
+        # limit. Typical chunks pass this and skip tokenization entirely.
+        candidates = [
+            idx for idx, text in enumerate(texts) if len(text) > max_tokens
+        ]
+        if not candidates:
+            return texts
+
+        encoding = self._encoding
+        token_lists = encoding.encode_ordinary_batch(
+            [texts[idx] for idx in candidates],
+            num_threads=os.cpu_count() or 1,
+        )
+        truncated: list[str | tuple[int, ...]] = list(texts)
+        for idx, tokens in zip(candidates, token_lists):
+            if len(tokens) > max_tokens:
+                logger.warning(
+                    f"Truncated text from {len(tokens)} to {max_tokens} tokens"
+                )
+                truncated[idx] = tuple(tokens[:max_tokens])
+        return truncated
+
+    def _pack_batches(
+        self, texts: list[str | tuple[int, ...]]
+    ) -> tuple[list[list[tuple[int, str | tuple[int, ...]]]], list[int]]:
+        """Pack texts into token-budgeted, length-homogeneous sub-batches.
+
+        Texts are sorted by token length (descending) and greedily packed
+        so each batch stays under the per-request token cap and item cap.
+        Each entry carries its original index so results can be scattered
+        back into input order after dispatch. Also returns the token
+        total per batch, which feeds the TPM bucket when one is
+        configured.
+        """
+        encoding = self._encoding
+        lengths = [0] * len(texts)
+        string_positions = [
+            idx for idx, text in enumerate(texts) if isinstance(text, str)
+        ]
+        if string_positions:
+            token_lists = encoding.encode_ordinary_batch(
+                [texts[idx] for idx in string_positions],
+                num_threads=os.cpu_count() or 1,
+            )
+            for idx, tokens in zip(string_positions, token_lists):
+                lengths[idx] = len(tokens)
+        for idx, text in enumerate(texts):
+            if not isinstance(text, str):
+                # Already-truncated entries are clipped token tuples.
+                lengths[idx] = len(text)
+
+        indexed_lengths = sorted(
+            enumerate(lengths), key=lambda pair: pair[1], reverse=True
+        )
+
+        batches: list[list[tuple[int, str | tuple[int, ...]]]] = []
+        token_totals: list[int] = []
+        batch: list[tuple[int, str | tuple[int, ...]]] = []
+        batch_tokens = 0
+        for idx, num_tokens in indexed_lengths:
+            if batch and (
+                batch_tokens + num_tokens
+                > self.config.max_tokens_per_request
+                or len(batch) >= self.embed_batch_size
+                # the API rejects requests mixing strings and token
+                # arrays in one input list
+                or isinstance(texts[idx], str)
+                != isinstance(batch[0][1], str)
+            ):
+                batches.append(batch)
+                token_totals.append(batch_tokens)
+                batch = []
+                batch_tokens = 0
+            batch.append((idx, texts[idx]))
+            batch_tokens += num_tokens
+        if batch:
+            batches.append(batch)
+            token_totals.append(batch_tokens)
+        return batches, token_totals
+
     def _get_embedding_kwargs(self, **kwargs):
-        return {
-            "model": self.base_model,
-            "dimensions": self._get_dimensions(),
-        } | kwargs
+        return self._base_kwargs | kwargs
+
+    @staticmethod
+    def _decode_embedding(embedding: Any) -> np.ndarray:
+        if isinstance(embedding, str):
+            return np.frombuffer(
+                base64.b64decode(embedding), dtype=np.float32
+            )
+        return np.asarray(embedding, dtype=np.float32)
 
-    async def _execute_task(self, task: dict[str, Any]) -> list[list[float]]:
+    def _resolve_output_dimensions(self, kwargs: dict[str, Any]) -> int:
+        dimensions = kwargs.get("dimensions")
+        if isinstance(dimensions, int):
+            return dimensions
+        return int(self.base_dimension)
+
+    async def _execute_task(self, task: dict[str, Any]) -> np.ndarray:
         texts = task["texts"]
         kwargs = self._get_embedding_kwargs(**task.get("kwargs", {}))
 
         try:
+            loop = asyncio.get_running_loop()
             # Truncate text if it exceeds the model's max input tokens. Some providers do this by default, others do not.
-            if kwargs.get("model"):
-                with contextlib.suppress(Exception):
-                    texts = truncate_texts_to_token_limit(
-                        texts, kwargs["model"]
-                    )
+            # Tokenization is CPU-bound and tiktoken releases the GIL, so
+            # run it in the default executor rather than blocking the
+            # event loop while other batches are in flight.
+            with contextlib.suppress(Exception):
+                texts = await loop.run_in_executor(
+                    None, self._truncate_texts_to_token_limit, texts
+                )
 
-            response = await self.async_client.embeddings.create(
-                input=texts,
-                **kwargs,
+            keys = [self._embed_cache_key(text, kwargs) for text in texts]
+            # One contiguous (N, D) float32 block instead of N Python
+            # lists: ~8x smaller and zero-copy into downstream consumers.
+            embeddings = np.empty(
+                (len(texts), self._resolve_output_dimensions(kwargs)),
+                dtype=np.float32,
             )
-            return [data.embedding for data in response.data]
-        except AuthenticationError as e:
-            raise ValueError(
-                "Invalid OpenAI API key provided. Please check your OPENAI_API_KEY environment variable."
-            ) from e
+            misses: list[int] = []
+            for i, key in enumerate(keys):
+                cached = self._embed_cache_get(key)
+                if cached is not None:
+                    embeddings[i] = cached
+                else:
+                    misses.append(i)
+            if not misses:
+                return embeddings
+
+            # Collapse duplicate texts (common after chunk normalization)
+            # so each unique string is transmitted and billed once.
+            unique_positions: dict[str | tuple[int, ...], list[int]] = {}
+            for i in misses:
+                unique_positions.setdefault(texts[i], []).append(i)
+            unique_texts = list(unique_positions)
+            batches, token_totals = await loop.run_in_executor(
+                None, self._pack_batches, unique_texts
+            )
+
+            async def embed_batch(
+                batch: list[tuple[int, str | tuple[int, ...]]],
+                estimated_tokens: int,
+            ):
+                # with_raw_response skips the SDK's Pydantic validation of
+                # every float; orjson decodes the body substantially faster
+                # than stdlib json.
+                if self._tpm_bucket is not None:
+                    await self._tpm_bucket.acquire(estimated_tokens)
+                async with self._batch_semaphore:
+                    async with (
+                        self._rpm_semaphore
+                        if self._rpm_semaphore is not None
+                        else contextlib.nullcontext()
+                    ):
+                        raw = await self.async_client.embeddings.with_raw_response.create(
+                            input=[
+                                text if isinstance(text, str) else list(text)
+                                for _, text in batch
+                            ],
+                            **kwargs,
+                        )
+                return orjson.loads(raw.content)["data"]
+
+            # Dispatch sub-batches concurrently; embedding requests are
+            # network-latency bound, so overlapping the HTTP round-trips
+            # gives near-linear speedups for large ingests.
+            responses = await asyncio.gather(
+                *(
+                    embed_batch(batch, estimated_tokens)
+                    for batch, estimated_tokens in zip(batches, token_totals)
+                )
+            )
+            for batch, response in zip(batches, responses):
+                for (unique_idx, _), data in zip(batch, response):
+                    embedding = self._decode_embedding(data["embedding"])
+                    positions = unique_positions[unique_texts[unique_idx]]
+                    for i in positions:
+                        embeddings[i] = embedding
+                    self._embed_cache_put(
+                        keys[positions[0]], embedding.astype(np.float32)
+                    )
+            return embeddings
+        except (AuthenticationError, BadRequestError, RateLimitError):
+            # Typed OpenAI errors propagate raw so the retry helpers can
+            # tell retryable 429s apart from terminal failures.
+            raise
         except Exception as e:
             error_msg = f"Error getting embeddings: {str(e)}"
             logger.error(error_msg)
             raise ValueError(error_msg) from e
 
-    def _execute_task_sync(self, task: dict[str, Any]) -> list[list[float]]:
+    def _execute_task_sync(self, task: dict[str, Any]) -> np.ndarray:
         texts = task["texts"]
         kwargs = self._get_embedding_kwargs(**task.get("kwargs", {}))
         try:
             # Truncate text if it exceeds the model's max input tokens. Some providers do this by default, others do not.
-            if kwargs.get("model"):
-                with contextlib.suppress(Exception):
-                    texts = truncate_texts_to_token_limit(
-                        texts, kwargs["model"]
-                    )
+            with contextlib.suppress(Exception):
+                texts = self._truncate_texts_to_token_limit(texts)
 
-            response = self.client.embeddings.create(
-                input=texts,
-                **kwargs,
+            keys = [self._embed_cache_key(text, kwargs) for text in texts]
+            # One contiguous (N, D) float32 block instead of N Python
+            # lists: ~8x smaller and zero-copy into downstream consumers.
+            embeddings = np.empty(
+                (len(texts), self._resolve_output_dimensions(kwargs)),
+                dtype=np.float32,
             )
-            return [data.embedding for data in response.data]
-        except AuthenticationError as e:
-            raise ValueError(
-                "Invalid OpenAI API key provided. Please check your OPENAI_API_KEY environment variable."
-            ) from e
+            misses: list[int] = []
+            for i, key in enumerate(keys):
+                cached = self._embed_cache_get(key)
+                if cached is not None:
+                    embeddings[i] = cached
+                else:
+                    misses.append(i)
+            if not misses:
+                return embeddings
+
+            # Collapse duplicate texts (common after chunk normalization)
+            # so each unique string is transmitted and billed once.
+            unique_positions: dict[str | tuple[int, ...], list[int]] = {}
+            for i in misses:
+                unique_positions.setdefault(texts[i], []).append(i)
+            unique_texts = list(unique_positions)
+            batches, _ = self._pack_batches(unique_texts)
+
+            def embed_batch(batch: list[tuple[int, str | tuple[int, ...]]]):
+                raw = self.client.embeddings.with_raw_response.create(
+                    input=[
+                        text if isinstance(text, str) else list(text)
+                        for _, text in batch
+                    ],
+                    **kwargs,
+                )
+                return orjson.loads(raw.content)["data"]
+
+            if len(batches) <= 1:
+                responses = [embed_batch(batch) for batch in batches]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=self.config.max_concurrent_batches
+                ) as executor:
+                    responses = list(executor.map(embed_batch, batches))
+            for batch, response in zip(batches, responses):
+                for (unique_idx, _), data in zip(batch, response):
+                    embedding = self._decode_embedding(data["embedding"])
+                    positions = unique_positions[unique_texts[unique_idx]]
+                    for i in positions:
+                        embeddings[i] = embedding
+                    self._embed_cache_put(
+                        keys[positions[0]], embedding.astype(np.float32)
+                    )
+            return embeddings
+        except (AuthenticationError, BadRequestError, RateLimitError):
+            # Typed OpenAI errors propagate raw so the retry helpers can
+            # tell retryable 429s apart from terminal failures.
+            raise
         except Exception as e:
             error_msg = f"Error getting embeddings: {str(e)}"
             logger.error(error_msg)
             raise ValueError(error_msg) from e
 
+    def _retry_delay(
+        self, attempt: int, exc: Optional[RateLimitError] = None
+    ) -> float:
+        """Exponential backoff with full jitter; 429s honor Retry-After."""
+        if exc is not None and exc.response is not None:
+            retry_after = exc.response.headers.get("retry-after")
+            if retry_after:
+                with contextlib.suppress(ValueError):
+                    return min(float(retry_after), self.config.max_backoff)
+        backoff = min(
+            self.config.max_backoff,
+            self.config.initial_backoff * (2 ** (attempt - 1)),
+        )
+        return random.uniform(0, backoff)
+
+    async def _execute_with_backoff_async(self, task: dict[str, Any]):
+        retries = 0
+        while True:
+            try:
+                async with self.semaphore:
+                    return await self._execute_task(task)
+            except AuthenticationError as e:
+                raise ValueError(
+                    "Invalid OpenAI API key provided. Please check your OPENAI_API_KEY environment variable."
+                ) from e
+            except BadRequestError as e:
+                # Malformed input cannot succeed on retry.
+                error_msg = f"Error getting embeddings: {str(e)}"
+                logger.error(error_msg)
+                raise ValueError(error_msg) from e
+            except (RateLimitError, ValueError) as e:
+                retries += 1
+                if retries >= self.config.max_retries:
+                    if isinstance(e, RateLimitError):
+                        raise ValueError(
+                            f"Error getting embeddings: {str(e)}"
+                        ) from e
+                    raise
+                logger.warning(
+                    f"Request failed (attempt {retries}): {str(e)}"
+                )
+                await asyncio.sleep(
+                    self._retry_delay(
+                        retries,
+                        e if isinstance(e, RateLimitError) else None,
+                    )
+                )
+
+    def _execute_with_backoff_sync(self, task: dict[str, Any]):
+        retries = 0
+        while True:
+            try:
+                return self._execute_task_sync(task)
+            except AuthenticationError as e:
+                raise ValueError(
+                    "Invalid OpenAI API key provided. Please check your OPENAI_API_KEY environment variable."
+                ) from e
+            except BadRequestError as e:
+                error_msg = f"Error getting embeddings: {str(e)}"
+                logger.error(error_msg)
+                raise ValueError(error_msg) from e
+            except (RateLimitError, ValueError) as e:
+                retries += 1
+                if retries >= self.config.max_retries:
+                    if isinstance(e, RateLimitError):
+                        raise ValueError(
+                            f"Error getting embeddings: {str(e)}"
+                        ) from e
+                    raise
+                logger.warning(
+                    f"Request failed (attempt {retries}): {str(e)}"
+                )
+                time.sleep(
+                    self._retry_delay(
+                        retries,
+                        e if isinstance(e, RateLimitError) else None,
+                    )
+                )
+
     async def async_get_embedding(
         self,
         text: str,
@@ -169,7 +661,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             "kwargs": kwargs,
         }
         result = await self._execute_with_backoff_async(task)
-        return result[0]
+        return result[0].tolist()
 
     def get_embedding(
         self,
@@ -188,7 +680,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             "kwargs": kwargs,
         }
         result = self._execute_with_backoff_sync(task)
-        return result[0]
+        return result[0].tolist()
 
     async def async_get_embeddings(
         self,
@@ -206,7 +698,10 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             "stage": stage,
             "kwargs": kwargs,
         }
-        return await self._execute_with_backoff_async(task)
+        # Internal plumbing carries a contiguous ndarray; convert at the
+        # public boundary since callers expect plain lists.
+        result = await self._execute_with_backoff_async(task)
+        return result.tolist()
 
     def get_embeddings(
         self,
@@ -224,7 +719,65 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             "stage": stage,
             "kwargs": kwargs,
         }
-        return self._execute_with_backoff_sync(task)
+        return self._execute_with_backoff_sync(task).tolist()
+
+    async def submit_batch_job(self, texts: list[str], **kwargs) -> str:
+        """Submit texts to the OpenAI Batch API and return the batch id.
+
+        For offline bulk embedding (index builds, re-ingests) the Batch
+        API costs half as much as the synchronous endpoint and queues
+        provider-side; results arrive within the 24h completion window
+        via poll_batch/retrieve_batch_results.
+        """
+        body_template = {
+            key: value
+            for key, value in self._get_embedding_kwargs(**kwargs).items()
+            if value is not NOT_GIVEN
+        }
+        lines = [
+            orjson.dumps(
+                {
+                    "custom_id": str(idx),
+                    "method": "POST",
+                    "url": "/v1/embeddings",
+                    "body": body_template | {"input": text},
+                }
+            )
+            for idx, text in enumerate(texts)
+        ]
+        input_file = await self.async_client.files.create(
+            file=("input.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = await self.async_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/embeddings",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def poll_batch(self, batch_id: str):
+        """Return the current Batch object; poll until its status is
+        `completed` before calling retrieve_batch_results."""
+        return await self.async_client.batches.retrieve(batch_id)
+
+    async def retrieve_batch_results(self, batch_id: str):
+        """Stream (custom_id, embedding) pairs from a completed batch."""
+        batch = await self.async_client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            raise ValueError(
+                f"Batch {batch_id} is not completed (status: {batch.status})."
+            )
+        output = await self.async_client.files.content(batch.output_file_id)
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            data = record["response"]["body"]["data"][0]
+            yield (
+                record["custom_id"],
+                self._decode_embedding(data["embedding"]).tolist(),
+            )
 
     def rerank(
         self,
@@ -245,9 +798,13 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         return results[:limit]
 
     def tokenize_string(self, text: str, model: str) -> list[int]:
+        if model == self.base_model:
+            # encode_ordinary skips the special-token regex sweep, which
+            # callers tokenizing document text never need.
+            return self._encoding.encode_ordinary(text)
         if model not in OpenAIEmbeddingProvider.MODEL_TO_TOKENIZER:
             raise ValueError(f"OpenAI embedding model {model} not supported.")
-        encoding = tiktoken.get_encoding(
+        encoding = _get_encoding(
             OpenAIEmbeddingProvider.MODEL_TO_TOKENIZER[model]
         )
-        return encoding.encode(text)
+        return encoding.encode_ordinary(text)
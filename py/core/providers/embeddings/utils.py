@@ -1,9 +1,39 @@
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 
 from litellm import get_model_info, token_counter
 
 logger = logging.getLogger(__name__)
 
+# Token counting is CPU-bound and O(len(text)); repeated inputs (queries,
+# re-ingests) are common, so cache counts keyed by (model, content hash).
+_TOKEN_COUNT_CACHE_MAXSIZE = 100_000
+_token_count_cache: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+_token_count_cache_lock = threading.Lock()
+
+
+def _cached_token_count(model: str, text: str) -> int:
+    key = (
+        model,
+        hashlib.blake2b(text.encode(), digest_size=16).digest(),
+    )
+    with _token_count_cache_lock:
+        count = _token_count_cache.get(key)
+        if count is not None:
+            _token_count_cache.move_to_end(key)
+            return count
+
+    count = token_counter(model=model, text=text)
+
+    with _token_count_cache_lock:
+        _token_count_cache[key] = count
+        _token_count_cache.move_to_end(key)
+        while len(_token_count_cache) > _TOKEN_COUNT_CACHE_MAXSIZE:
+            _token_count_cache.popitem(last=False)
+    return count
+
 
 def truncate_texts_to_token_limit(texts: list[str], model: str) -> list[str]:
     """
@@ -16,7 +46,7 @@ def truncate_texts_to_token_limit(texts: list[str], model: str) -> list[str]:
 
         truncated_texts = []
         for text in texts:
-            text_tokens = token_counter(model=model, text=text)
+            text_tokens = _cached_token_count(model, text)
             assert model_info["max_input_tokens"]
             if text_tokens > model_info["max_input_tokens"]:
                 estimated_chars = (